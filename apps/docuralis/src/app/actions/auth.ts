@@ -23,6 +23,7 @@ export async function register(formData: FormData) {
   // Check if user exists
   const existingUser = await prisma.user.findUnique({
     where: { email },
+    select: { id: true },
   })
 
   if (existingUser) {
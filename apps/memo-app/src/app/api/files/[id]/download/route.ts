@@ -1,3 +1,4 @@
+import { Readable } from "node:stream";
 import { type NextRequest, NextResponse } from "next/server";
 import { fileService } from "@/services";
 
@@ -12,14 +13,10 @@ export async function GET(
     const { id } = await params;
     const { stream, file } = await fileService.getFileStream(id);
 
-    // Convert stream to buffer
-    const chunks: Buffer[] = [];
-    for await (const chunk of stream) {
-      chunks.push(chunk);
-    }
-    const buffer = Buffer.concat(chunks);
+    // Stream the object straight from MinIO instead of buffering it
+    const body = Readable.toWeb(stream) as ReadableStream<Uint8Array>;
 
-    return new NextResponse(buffer, {
+    return new NextResponse(body, {
       headers: {
         "Content-Type": file.mimeType,
         "Content-Disposition": `attachment; filename="${file.filename}"`,
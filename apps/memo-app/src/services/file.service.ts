@@ -1,3 +1,4 @@
+import type { Readable } from "node:stream";
 import type { FileFilters, UploadFileInput } from "@/dto";
 import { bucketName, minioClient } from "@/lib/minio";
 import { prisma } from "@/lib/prisma";
@@ -127,7 +128,7 @@ export class FileService {
   /**
    * Get file stream from MinIO
    */
-  async getFileStream(id: string): Promise<{ stream: any; file: File }> {
+  async getFileStream(id: string): Promise<{ stream: Readable; file: File }> {
     const file = await this.getFileById(id);
     if (!file) {
       throw new Error("File not found");